@@ -75,16 +75,21 @@ infrastructure that is essential to run the coordinator with default or optional
 Keep in mind that this file is used for development only.
 
 ```bash
-docker-compose -f docker/docker-compose.yml up --build
+docker compose -f docker/docker-compose.yml up --build
 ```
 
+The `Dockerfile` caches the Rust build between image builds and therefore requires
+[BuildKit](https://docs.docker.com/build/buildkit/). BuildKit is used by default by
+`docker compose` (v2) and Docker Engine 23.0+. With older versions, prefix the commands with
+`DOCKER_BUILDKIT=1` (and additionally `COMPOSE_DOCKER_CLI_BUILD=1` for `docker-compose` v1).
+
 #### Create a release build
 
 If you would like, you can create an optimized release build of the coordinator,
 but keep in mind that the compilation will be slower.
 
 ```bash
-docker build --build-arg RELEASE_BUILD=1 -f ./docker/Dockerfile .
+DOCKER_BUILDKIT=1 docker build --build-arg RELEASE_BUILD=1 -f ./docker/Dockerfile .
 ```
 
 #### Build a coordinator with optional features
@@ -92,7 +97,7 @@ docker build --build-arg RELEASE_BUILD=1 -f ./docker/Dockerfile .
 Optional features can be specified via the build argument `COORDINATOR_FEATURES`.
 
 ```bash
-docker build --build-arg COORDINATOR_FEATURES=tls,metrics -f ./docker/Dockerfile .
+DOCKER_BUILDKIT=1 docker build --build-arg COORDINATOR_FEATURES=tls,metrics -f ./docker/Dockerfile .
 ```
 
 ### Using Kubernetes
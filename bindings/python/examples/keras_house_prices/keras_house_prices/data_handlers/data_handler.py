@@ -224,9 +224,9 @@ class DataHandler(ABC):  # pylint: disable=too-many-instance-attributes
                 for label, ids in participant_ids_by_label.items()
                 if participant_id in ids
             ]
-        selected_samples: np.ndarray = np.array(
-            [i for i, label in discrete_y.items() if label in selected_labels]
-        )
+        selected_samples: np.ndarray = discrete_y.index[
+            discrete_y.isin(selected_labels)
+        ].to_numpy()
         return selected_samples
 
     def make_intermediate_split(
@@ -321,7 +321,7 @@ class DataHandler(ABC):  # pylint: disable=too-many-instance-attributes
             )
             participant_df.to_csv(output_filepath, index=False)
             LOG.info("participant df saved to %s", output_filepath)
-            assigned_samples.extend(participant_df.index)
+            assigned_samples.extend(participant_df.index.tolist())
 
     def run(self) -> None:
         """One function to run them all."""
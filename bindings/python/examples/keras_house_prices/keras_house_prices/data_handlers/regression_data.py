@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+from typing import Any, Dict
 
 from keras_house_prices.data_handlers.data_handler import DataHandler
 import numpy as np
@@ -24,59 +25,62 @@ class RegressionData(DataHandler):
     def fill_nan(self) -> None:
         """Filling missing data in the dataframe."""
 
-        self.train_df["PoolQC"] = self.train_df["PoolQC"].fillna("None")
-        self.train_df["MiscFeature"] = self.train_df["MiscFeature"].fillna("None")
-        self.train_df["Alley"] = self.train_df["Alley"].fillna("None")
-        self.train_df["Fence"] = self.train_df["Fence"].fillna("None")
-        self.train_df["FireplaceQu"] = self.train_df["FireplaceQu"].fillna("None")
-        self.train_df["LotFrontage"] = self.train_df.groupby("Neighborhood")[
-            "LotFrontage"
-        ].transform(lambda x: x.fillna(x.median()))
-        for col in ("GarageType", "GarageFinish", "GarageQual", "GarageCond"):
-            self.train_df[col] = self.train_df[col].fillna("None")
-        for col in ("GarageYrBlt", "GarageArea", "GarageCars"):
-            self.train_df[col] = self.train_df[col].fillna(0)
-        for col in (
-            "BsmtFinSF1",
-            "BsmtFinSF2",
-            "BsmtUnfSF",
-            "TotalBsmtSF",
-            "BsmtFullBath",
-            "BsmtHalfBath",
-        ):
-            self.train_df[col] = self.train_df[col].fillna(0)
-        for col in (
-            "BsmtQual",
-            "BsmtCond",
-            "BsmtExposure",
-            "BsmtFinType1",
-            "BsmtFinType2",
-        ):
-            self.train_df[col] = self.train_df[col].fillna("None")
-        self.train_df["MSZoning"] = self.train_df["MSZoning"].fillna(
-            self.train_df["MSZoning"].mode()[0]
-        )
-
-        self.train_df["MasVnrType"] = self.train_df["MasVnrType"].fillna("None")
-        self.train_df["MasVnrArea"] = self.train_df["MasVnrArea"].fillna(0)
-        self.train_df = self.train_df.drop(["Utilities"], axis=1)
-        self.train_df["Functional"] = self.train_df["Functional"].fillna("Typ")
-        self.train_df["Electrical"] = self.train_df["Electrical"].fillna(
-            self.train_df["Electrical"].mode()[0]
-        )
-        self.train_df["KitchenQual"] = self.train_df["KitchenQual"].fillna(
-            self.train_df["KitchenQual"].mode()[0]
-        )
-        self.train_df["Exterior1st"] = self.train_df["Exterior1st"].fillna(
-            self.train_df["Exterior1st"].mode()[0]
-        )
-        self.train_df["Exterior2nd"] = self.train_df["Exterior2nd"].fillna(
-            self.train_df["Exterior2nd"].mode()[0]
-        )
-        self.train_df["SaleType"] = self.train_df["SaleType"].fillna(
-            self.train_df["SaleType"].mode()[0]
-        )
-        self.train_df["MSSubClass"] = self.train_df["MSSubClass"].fillna("None")
+        fill_values: Dict[str, Any] = {
+            **dict.fromkeys(
+                (
+                    "PoolQC",
+                    "MiscFeature",
+                    "Alley",
+                    "Fence",
+                    "FireplaceQu",
+                    "GarageType",
+                    "GarageFinish",
+                    "GarageQual",
+                    "GarageCond",
+                    "BsmtQual",
+                    "BsmtCond",
+                    "BsmtExposure",
+                    "BsmtFinType1",
+                    "BsmtFinType2",
+                    "MasVnrType",
+                    "MSSubClass",
+                ),
+                "None",
+            ),
+            **dict.fromkeys(
+                (
+                    "GarageYrBlt",
+                    "GarageArea",
+                    "GarageCars",
+                    "BsmtFinSF1",
+                    "BsmtFinSF2",
+                    "BsmtUnfSF",
+                    "TotalBsmtSF",
+                    "BsmtFullBath",
+                    "BsmtHalfBath",
+                    "MasVnrArea",
+                ),
+                0,
+            ),
+            **{
+                col: self.train_df[col].mode()[0]
+                for col in (
+                    "MSZoning",
+                    "Electrical",
+                    "KitchenQual",
+                    "Exterior1st",
+                    "Exterior2nd",
+                    "SaleType",
+                )
+            },
+            "Functional": "Typ",
+            "LotFrontage": self.train_df.groupby("Neighborhood")[
+                "LotFrontage"
+            ].transform("median"),
+        }
+
+        # declare the fill value of every column in one place
+        self.train_df = self.train_df.fillna(fill_values).drop(["Utilities"], axis=1)
 
         no_nulls_in_dataset = not self.train_df.isnull().values.any()
         if no_nulls_in_dataset:
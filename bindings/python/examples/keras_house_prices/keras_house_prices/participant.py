@@ -81,8 +81,8 @@ class Participant(  # pylint: disable=too-few-public-methods,too-many-instance-a
         """
         if training_input is None:
             # This is the first round: the coordinator doesn't have a
-            # global model yet, so we need to initialize the weights
-            self.regressor = Regressor(len(self.trainset_x.columns))
+            # global model yet, so we return the initial weights of the
+            # model that was built and compiled in `__init__`
             return self.regressor.get_weights()
 
         weights = training_input
@@ -101,7 +101,8 @@ class Participant(  # pylint: disable=too-few-public-methods,too-many-instance-a
         return self.regressor.get_weights()
 
     def deserialize_training_input(self, global_model: list) -> np.ndarray:
-        return np.array(global_model)
+        # match the float32 Regressor weights so set_weights doesn't cast
+        return np.asarray(global_model, dtype=np.float32)
 
     def serialize_training_result(self, training_result: np.ndarray) -> list:
         return training_result.tolist()
@@ -3,7 +3,7 @@ from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import r2_score
+from sklearn.metrics import mean_squared_error, r2_score
 from tensorflow.keras import Sequential  # pylint: disable=import-error
 from tensorflow.keras.layers import Dense  # pylint: disable=import-error
 
@@ -24,6 +24,13 @@ class Regressor:
 
         self.model.compile(optimizer="adam", loss="mean_squared_error")
 
+        # the architecture is fixed, so the offsets at which the flat weights are
+        # split into the per-layer weights only need to be computed once
+        self._shapes: List[Tuple[int, ...]] = self.get_shapes()
+        self._split_indices: np.ndarray = np.cumsum(
+            [np.prod(shape) for shape in self._shapes]
+        )
+
     def train_n_epochs(
         self, n_epochs: int, x_train: pd.DataFrame, y_train: pd.DataFrame
     ) -> None:
@@ -54,25 +61,26 @@ class Regressor:
 
         y_pred: np.ndarray = self.model.predict(x_test)
         r_squared: float = r2_score(y_test, y_pred)
-        test_loss: float = self.model.evaluate(x_test, y_test)
+        # the model is compiled with the mean squared error loss, so the test loss can
+        # be computed from the predictions instead of a second pass over the testset
+        test_loss: float = mean_squared_error(y_test, y_pred)
         return test_loss, r_squared
 
     def get_shapes(self) -> List[Tuple[int, ...]]:
-        return [weight.shape for weight in self.model.get_weights()]
+        # read the shapes from the variables, `get_weights` would copy every weight
+        return [tuple(weight.shape) for weight in self.model.weights]
 
     def get_weights(self) -> np.ndarray:
         return np.concatenate(self.model.get_weights(), axis=None)
 
     def set_weights(self, weights: np.ndarray) -> None:
-        shapes = self.get_shapes()
         # expand the flat weights
-        indices: np.ndarray = np.cumsum([np.prod(shape) for shape in shapes])
         tensorflow_weights: List[np.ndarray] = np.split(
-            weights, indices_or_sections=indices
+            weights, indices_or_sections=self._split_indices
         )
         tensorflow_weights = [
             np.reshape(weight, newshape=shape)
-            for weight, shape in zip(tensorflow_weights, shapes)
+            for weight, shape in zip(tensorflow_weights, self._shapes)
         ]
 
         # apply the weights to the tensorflow model
@@ -44,41 +44,24 @@ def main() -> None:
         datefmt="%b %d %H:%M:%S",
     )
 
-    participant = xaynet_sdk.spawn_participant(
-        "http://127.0.0.1:8081",
-        Participant,
-        args=(
-            1,
-            [0.1, 0.2, 0.345, 0.3],
-        ),
-    )
-
-    participant_2 = xaynet_sdk.spawn_participant(
-        "http://127.0.0.1:8081",
-        Participant,
-        args=(
-            2,
-            [0.3, 0.4, 0.45, 0.1],
-        ),
-    )
-
-    participant_3 = xaynet_sdk.spawn_participant(
-        "http://127.0.0.1:8081",
-        Participant,
-        args=(
-            3,
-            [0.123, 0.1567, 0.123, 0.46],
-        ),
-    )
+    models = [
+        [0.1, 0.2, 0.345, 0.3],
+        [0.3, 0.4, 0.45, 0.1],
+        [0.123, 0.1567, 0.123, 0.46],
+    ]
+    participants = [
+        xaynet_sdk.spawn_participant(
+            "http://127.0.0.1:8081", Participant, args=(p_id, model)
+        )
+        for p_id, model in enumerate(models, start=1)
+    ]
 
     try:
-        participant.join()
-        participant_2.join()
-        participant_3.join()
+        for participant in participants:
+            participant.join()
     except KeyboardInterrupt:
-        participant.stop()
-        participant_2.stop()
-        participant_3.stop()
+        for participant in participants:
+            participant.stop()
 
 
 if __name__ == "__main__":
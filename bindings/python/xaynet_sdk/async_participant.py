@@ -66,9 +66,8 @@ class AsyncParticipant(threading.Thread):
 
         if made_progress:
             self._poll_period.reset()
-            self._exit_event.wait(timeout=self._poll_period.duration())
-        else:
-            self._exit_event.wait(timeout=self._poll_period.duration())
+        # returns early as soon as `stop` sets the exit event
+        self._exit_event.wait(timeout=self._poll_period.duration())
 
     def get_global_model(self) -> Optional[list]:
         """
@@ -146,7 +146,7 @@ class InternalParticipant(threading.Thread):
         super().__init__(daemon=True)
 
     def run(self):
-        self._participant = self._participant(*self._p_args, *self._p_kwargs)
+        self._participant = self._participant(*self._p_args, **self._p_kwargs)
 
         try:
             self._run()
@@ -213,9 +213,8 @@ class InternalParticipant(threading.Thread):
 
         if made_progress:
             self._poll_period.reset()
-            self._exit_event.wait(timeout=self._poll_period.duration())
-        else:
-            self._exit_event.wait(timeout=self._poll_period.duration())
+        # returns early as soon as `stop` sets the exit event
+        self._exit_event.wait(timeout=self._poll_period.duration())
 
     def stop(self) -> List[int]:
         """